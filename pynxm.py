@@ -16,23 +16,103 @@
 
 __version__ = "0.1.0"
 
+import asyncio
+import importlib.util
 import json
 import platform
+import random
+import re
+import threading
+import time
 import uuid
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import quote_plus, urlencode
 
 import requests
 from websocket import create_connection
 
-USER_AGENT = "pynxm/{} ({}; {}) {}/{}".format(
-    __version__,
-    platform.platform(),
-    platform.architecture()[0],
-    platform.python_implementation(),
-    platform.python_version(),
-)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# only ask for brotli when there's something around to decode it
+if any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")):
+    _ACCEPT_ENCODING = "gzip, br, deflate"
+else:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+# built by _user_agent() when the first client is created
+USER_AGENT = None
+
+
+def _user_agent():
+    # platform.platform() may spawn a process, so only
+    # build the user agent once it is actually needed
+    global USER_AGENT
+    if USER_AGENT is None:
+        USER_AGENT = "pynxm/{} ({}; {}) {}/{}".format(
+            __version__,
+            platform.platform(),
+            platform.architecture()[0],
+            platform.python_implementation(),
+            platform.python_version(),
+        )
+    return USER_AGENT
+
+
 BASE_URL = "https://api.nexusmods.com/v1/"
 
+# the rate limit headers sent along with every response
+_NEXUS_HDR_KEYS = (
+    "X-RL-Hourly-Limit",
+    "X-RL-Hourly-Remaining",
+    "X-RL-Hourly-Reset",
+    "X-RL-Daily-Limit",
+    "X-RL-Daily-Remaining",
+    "X-RL-Daily-Reset",
+)
+
+_VALID_PERIODS = frozenset(("1d", "1w", "1m"))
+_PERIOD_ERR = "Allowed values for 'period' argument: '1d', '1w', '1m'."
+
+# retry delays for transient errors, in seconds
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30
+
+_FORM_HDR = {"content-type": "application/x-www-form-urlencoded"}
+
+# endpoint urls are built once here rather than on every request
+_URL_COLOUR_SCHEMES = BASE_URL + "colourschemes.json"
+_URL_USER_DETAILS = BASE_URL + "users/validate.json"
+_URL_USER_TRACKED = BASE_URL + "user/tracked_mods.json"
+_URL_USER_ENDORSEMENTS = BASE_URL + "user/endorsements.json"
+_URL_GAME_LIST = BASE_URL + "games.json"
+_URL_GAME_DETAILS = (BASE_URL + "games/{}.json").format
+_URL_GAME_UPDATED = (BASE_URL + "games/{}/mods/updated.json").format
+_URL_GAME_LATEST_ADDED = (BASE_URL + "games/{}/mods/latest_added.json").format
+_URL_GAME_LATEST_UPDATED = (BASE_URL + "games/{}/mods/latest_updated.json").format
+_URL_GAME_TRENDING = (BASE_URL + "games/{}/mods/trending.json").format
+_URL_MOD_DETAILS = (BASE_URL + "games/{}/mods/{}.json").format
+_URL_MOD_SEARCH = (BASE_URL + "games/{}/mods/md5_search/{}.json").format
+_URL_MOD_ENDORSE = (BASE_URL + "games/{}/mods/{}/endorse.json").format
+_URL_MOD_ABSTAIN = (BASE_URL + "games/{}/mods/{}/abstain.json").format
+_URL_MOD_FILE_LIST = (BASE_URL + "games/{}/mods/{}/files.json").format
+_URL_MOD_FILE_DETAILS = (BASE_URL + "games/{}/mods/{}/files/{}.json").format
+_URL_MOD_FILE_DOWNLOAD_LINK = (
+    BASE_URL + "games/{}/mods/{}/files/{}/download_link.json"
+).format
+_URL_MOD_CHANGELOG_LIST = (BASE_URL + "games/{}/mods/{}/changelogs.json").format
+
 
 class LimitReachedError(Exception):
     """
@@ -50,22 +130,203 @@ class RequestError(Exception):
     pass
 
 
+class TokenBucket(object):
+    """
+    A thread-safe token bucket used to pace requests to the Nexus API.
+
+    The bucket lets every request through until it is seeded with the
+    rate limit headers of a response. From then on it allows bursts up to
+    the remaining quota and spreads any further requests over the time
+    left until the quota resets, instead of running into the limit.
+
+    :param capacity: The maximum number of tokens held by the bucket.
+    :param refill_rate: The number of tokens added per second.
+    :param max_wait: The longest, in seconds, a request may be held back.
+                     Requests that would have to wait longer raise
+                     'LimitReachedError' instead. Set to None to always wait.
+    """
+
+    def __init__(self, capacity=None, refill_rate=None, max_wait=60):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_wait = max_wait
+        self.tokens = capacity
+        self._backoff = 1.0
+        self._reset_at = None
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes a token from the bucket.
+
+        :return: The number of seconds to wait before using the token.
+        """
+        with self._lock:
+            if self.capacity is None or not self.refill_rate:
+                return 0
+            now = time.monotonic()
+            rate = self.refill_rate * self._backoff
+            tokens = min(self.capacity, self.tokens + (now - self._last) * rate)
+            delay = max(1 - tokens, 0) / rate
+            # the whole quota is back once it resets, so never wait any longer
+            if self._reset_at is not None:
+                delay = min(delay, max(self._reset_at - now, 0))
+            if self.max_wait is not None and delay > self.max_wait:
+                self.tokens = tokens
+                self._last = now
+                raise LimitReachedError(
+                    "You have reached your request limit. "
+                    "Please wait {:.0f} seconds before trying again.".format(delay)
+                )
+            self.tokens = tokens - 1
+            self._last = now
+            return delay
+
+    def acquire(self):
+        """
+        Takes a token from the bucket, sleeping until it is available.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def update(self, headers, limited=False):
+        """
+        Re-seeds the bucket from the rate limit headers of a response.
+
+        :param headers: The response headers.
+        :param limited: Whether the request was refused for going over the limit,
+                        in which case requests are spaced twice as far apart
+                        (never past the reset) until they go through again.
+        """
+        # the daily quota is used up first, hourly requests only kick in after
+        try:
+            if int(headers["X-RL-Daily-Remaining"]) > 0:
+                window = "Daily"
+            else:
+                window = "Hourly"
+            limit = int(headers["X-RL-{}-Limit".format(window)])
+            remaining = int(headers["X-RL-{}-Remaining".format(window)])
+            reset = _seconds_until(headers["X-RL-{}-Reset".format(window)])
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            if limited:
+                self._backoff = max(self._backoff / 2, 1 / 64)
+            else:
+                self._backoff = min(self._backoff * 1.25, 1.0)
+            self.capacity = limit
+            self.tokens = min(limit, remaining)
+            # once the quota runs out, the next token shows up when it resets
+            self.refill_rate = max(remaining, 1) / reset
+            self._last = time.monotonic()
+            self._reset_at = self._last + reset
+
+
+def _backoff_delay(attempt):
+    # exponential backoff with full jitter, so clients don't retry in lockstep
+    return random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt))
+
+
+def _seconds_until(timestamp):
+    # strptime only accepts utc offsets without a colon in older pythons
+    timestamp = re.sub(r"([+-]\d\d):(\d\d)$", r"\1\2", timestamp.strip())
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S%z", "%Y-%m-%d %H:%M:%S %z"):
+        try:
+            reset = datetime.strptime(timestamp, fmt)
+        except ValueError:
+            continue
+        return max((reset - datetime.now(timezone.utc)).total_seconds(), 1)
+    raise ValueError("Unknown timestamp format: {}".format(timestamp))
+
+
+class _ETagCache(object):
+    # a thread-safe lru cache of (etag, raw body) pairs for GET responses,
+    # bodies are decoded again on every hit so callers never share objects
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, etag, content):
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = (etag, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class Nexus(object):
     """
     The class used for connecting to the Nexus API.
     Requires an API key from your Nexus account.
+
+    :param api_key: A string with your Nexus API key.
+    :param pool_size: The maximum number of connections kept open to the API.
+                      Set this to at least the number of threads
+                      making concurrent requests.
+    :param cache_size: The maximum number of GET responses kept around to be
+                       revalidated with their ETag instead of downloaded again.
+                       Set to 0 to disable the cache.
+    :param max_retries: How many times to retry a request after a connection error,
+                        a 503 or 504 response or a 429 response with a
+                        short 'Retry-After', backing off exponentially.
+    :param max_wait: The longest, in seconds, a request may be held back to stay
+                     within the rate limit before 'LimitReachedError' is raised.
+                     Set to None to always wait.
+
+    After each request, the rate limit headers sent by Nexus
+    are available in the 'nexus_headers' dictionary and
+    are used to pace further requests through 'bucket', a 'TokenBucket'.
     """
 
-    def __init__(self, api_key):
-        self.session = requests.Session()
-        self.session.headers.update(
+    __slots__ = (
+        "session",
+        "pool_size",
+        "max_retries",
+        "nexus_headers",
+        "bucket",
+        "_etag_cache",
+    )
+
+    def __init__(
+        self, api_key, pool_size=32, cache_size=128, max_retries=3, max_wait=60
+    ):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.nexus_headers = {}
+        self.bucket = TokenBucket(max_wait=max_wait)
+        self._etag_cache = _ETagCache(cache_size)
+        self._setup_session(
             {
-                "user-agent": USER_AGENT,
+                "user-agent": _user_agent(),
                 "apikey": api_key,
                 "content-type": "application/json",
+                "accept-encoding": _ACCEPT_ENCODING,
             }
         )
 
+    def _setup_session(self, headers):
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        # the default pool only keeps 10 connections around,
+        # anything above that is reopened (with a new TLS handshake) every time
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        self.session.mount("https://", adapter)
+
     @classmethod
     def sso(cls, app_slug, sso_token, sso_id=None):
         """
@@ -81,12 +342,67 @@ class Nexus(object):
             sso_id = str(uuid.uuid4())
         ws.send(json.dumps({"id": sso_id, "token": sso_token}))
         webbrowser.open(
-            "https://www.nexusmods.com/"
-            "sso?id={}&application={}".format(sso_id, app_slug)
+            "https://www.nexusmods.com/sso?"
+            + urlencode({"id": sso_id, "application": app_slug})
         )
         api_key = ws.recv()
         return cls(api_key)
 
+    def _update_nexus_headers(self, headers, status_code):
+        self.nexus_headers = {k: headers[k] for k in _NEXUS_HDR_KEYS if k in headers}
+        self.bucket.update(self.nexus_headers, limited=status_code == 429)
+
+    def _cache_lookup(self, operation, endpoint, payload, headers):
+        # returns the cache key and entry (if any) for GET requests,
+        # adding the header needed to revalidate a cached response
+        if operation.lower() != "get":
+            return None, None, headers
+        key = (endpoint, frozenset(payload.items()))
+        cached = self._etag_cache.get(key)
+        if cached is not None:
+            headers = dict(headers)
+            headers["If-None-Match"] = cached[0]
+        return key, cached, headers
+
+    def _retry_delay(self, attempt, status_code, headers):
+        # returns how long to wait before retrying, or None to not retry
+        if attempt == self.max_retries:
+            return None
+        if status_code in (503, 504):
+            return _backoff_delay(attempt)
+        if status_code == 429:
+            try:
+                retry_after = float(headers["Retry-After"])
+            except (KeyError, ValueError):
+                return None
+            # an hour long wait is better left to the caller
+            if retry_after <= _BACKOFF_CAP:
+                return retry_after
+        return None
+
+    @staticmethod
+    def _raise_for_status(status_code, content, reason):
+        if status_code == 429:
+            raise LimitReachedError(
+                "You have reached your request limit. "
+                "Please wait one hour before trying again."
+            )
+        try:
+            body = _loads(content)
+        except ValueError:
+            body = None
+        if isinstance(body, dict):
+            msg = body.get("message") or body.get("error") or reason
+        else:
+            msg = reason
+        raise RequestError("Status Code {} - {}".format(status_code, msg))
+
+    def _map_concurrently(self, func, iterable, max_workers=None):
+        # requests sessions can be shared between threads and the
+        # connection pool is already sized for 'pool_size' of them
+        with ThreadPoolExecutor(max_workers or self.pool_size) as executor:
+            return list(executor.map(func, iterable))
+
     def _make_request(self, operation, endpoint, payload=None, data=None, headers=None):
         if payload is None:
             payload = {}
@@ -94,47 +410,64 @@ class Nexus(object):
             data = {}
         if headers is None:
             headers = {}
-        response = self.session.request(
-            operation.upper(),
-            BASE_URL + endpoint,
-            params=payload,
-            data=data,
-            headers=headers,
-            timeout=30,
+        if not endpoint.startswith(("http://", "https://")):
+            endpoint = BASE_URL + endpoint
+        cache_key, cached, headers = self._cache_lookup(
+            operation, endpoint, payload, headers
         )
-        status_code = response.status_code
-        if status_code not in (200, 201):
-            if status_code == 429:
-                raise LimitReachedError(
-                    "You have reached your request limit. "
-                    "Please wait one hour before trying again."
+        throttle = True
+        for attempt in range(self.max_retries + 1):
+            # a retry after 'Retry-After' has already waited as long as needed
+            if throttle:
+                self.bucket.acquire()
+            throttle = True
+            try:
+                response = self.session.request(
+                    operation.upper(),
+                    endpoint,
+                    params=payload,
+                    data=data,
+                    headers=headers,
+                    timeout=30,
                 )
-            else:
-                try:
-                    msg = response.json()["message"]
-                except KeyError:
-                    msg = response.json()["error"]
-                raise RequestError("Status Code {} - {}".format(status_code, msg))
-        return response.json()
+            except requests.exceptions.ConnectionError:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+                continue
+            status_code = response.status_code
+            self._update_nexus_headers(response.headers, status_code)
+            delay = self._retry_delay(attempt, status_code, response.headers)
+            if delay is None:
+                break
+            throttle = status_code != 429
+            time.sleep(delay)
+        if status_code == 304 and cached is not None:
+            return _loads(cached[1])
+        if status_code not in (200, 201):
+            self._raise_for_status(status_code, response.content, response.reason)
+        if cache_key is not None and "ETag" in response.headers:
+            self._etag_cache.put(cache_key, response.headers["ETag"], response.content)
+        return _loads(response.content)
 
     def colour_schemes_list(self):
         """
         Returns a list of all colour schemes, including the
         primary, secondary and 'darker' colours.
         """
-        return self._make_request("get", "colourschemes.json")
+        return self._make_request("get", _URL_COLOUR_SCHEMES)
 
     def user_details(self):
         """
         Returns the user's details.
         """
-        return self._make_request("get", "users/validate.json")
+        return self._make_request("get", _URL_USER_DETAILS)
 
     def user_tracked_list(self):
         """
         Returns a list of all the mods being tracked by the current user.
         """
-        return self._make_request("get", "user/tracked_mods.json")
+        return self._make_request("get", _URL_USER_TRACKED)
 
     def user_tracked_add(self, game, mod_id):
         """
@@ -143,12 +476,23 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param mod_id: A string the mod id.
         """
-        self._make_request(
+        return self._make_request(
             "post",
-            "user/tracked_mods.json",
+            _URL_USER_TRACKED,
             payload={"domain_name": game},
-            data={"mod_id": mod_id},
-            headers={"content-type": "application/x-www-form-urlencoded"},
+            data="mod_id=" + quote_plus(str(mod_id)),
+            headers=_FORM_HDR,
+        )
+
+    def user_tracked_add_many(self, game, mod_ids):
+        """
+        Tracks several mods with the current user, sending the requests concurrently.
+
+        :param game: A string with Nexus' game domain.
+        :param mod_ids: An iterable of mod id strings.
+        """
+        return self._map_concurrently(
+            lambda mod_id: self.user_tracked_add(game, mod_id), mod_ids
         )
 
     def user_tracked_delete(self, game, mod_id):
@@ -158,19 +502,19 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param mod_id: A string the mod id.
         """
-        self._make_request(
+        return self._make_request(
             "delete",
-            "user/tracked_mods.json",
+            _URL_USER_TRACKED,
             payload={"domain_name": game},
-            data={"mod_id": mod_id},
-            headers={"content-type": "application/x-www-form-urlencoded"},
+            data="mod_id=" + quote_plus(str(mod_id)),
+            headers=_FORM_HDR,
         )
 
     def user_endorsements_list(self):
         """
         Returns a list of all endorsements for the current user.
         """
-        return self._make_request("get", "user/endorsements.json")
+        return self._make_request("get", _URL_USER_ENDORSEMENTS)
 
     def game_details(self, game):
         """
@@ -178,7 +522,7 @@ class Nexus(object):
 
         :param game: A string with Nexus' game domain.
         """
-        return self._make_request("get", "games/{}.json".format(game))
+        return self._make_request("get", _URL_GAME_DETAILS(game))
 
     def game_list(self, include_unapproved=False):
         """
@@ -187,7 +531,7 @@ class Nexus(object):
         :param include_unapproved: A boolean on whether to include unapproved games.
         """
         return self._make_request(
-            "get", "games.json", payload={"include_unapproved": include_unapproved}
+            "get", _URL_GAME_LIST, payload={"include_unapproved": include_unapproved}
         )
 
     def game_updated_list(self, game, period):
@@ -198,10 +542,10 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param period: Acceptable values: '1d' (1 day), '1w' (1 week) or '1m' (1 month).
         """
-        if period not in ("1d", "1w", "1m"):
-            raise ValueError("Allowed values for 'period' argument: '1d', '1w', '1m'.")
+        if period not in _VALID_PERIODS:
+            raise ValueError(_PERIOD_ERR)
         return self._make_request(
-            "get", "games/{}/mods/updated.json".format(game), payload={"period": period}
+            "get", _URL_GAME_UPDATED(game), payload={"period": period}
         )
 
     def game_latest_added_list(self, game):
@@ -210,7 +554,7 @@ class Nexus(object):
 
         :param game: A string with Nexus' game domain.
         """
-        return self._make_request("get", "games/{}/mods/latest_added.json".format(game))
+        return self._make_request("get", _URL_GAME_LATEST_ADDED(game))
 
     def game_latest_updated_list(self, game):
         """
@@ -218,9 +562,7 @@ class Nexus(object):
 
         :param game: A string with Nexus' game domain.
         """
-        return self._make_request(
-            "get", "games/{}/mods/latest_updated.json".format(game)
-        )
+        return self._make_request("get", _URL_GAME_LATEST_UPDATED(game))
 
     def game_trending_list(self, game):
         """
@@ -228,7 +570,7 @@ class Nexus(object):
 
         :param game: A string with Nexus' game domain.
         """
-        return self._make_request("get", "games/{}/mods/trending.json".format(game))
+        return self._make_request("get", _URL_GAME_TRENDING(game))
 
     def mod_details(self, game, mod_id):
         """
@@ -237,7 +579,23 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param mod_id: A string the mod id.
         """
-        return self._make_request("get", "games/{}/mods/{}.json".format(game, mod_id))
+        return self._make_request("get", _URL_MOD_DETAILS(game, mod_id))
+
+    def mod_details_many(self, game, mod_ids, max_workers=None):
+        """
+        Retrieve the details of several mods from a specified game,
+        sending the requests concurrently from a pool of threads
+        that share this instance's connections.
+
+        :param game: A string with Nexus' game domain.
+        :param mod_ids: An iterable of mod id strings.
+        :param max_workers: The maximum number of concurrent requests,
+                            defaults to 'pool_size'.
+        :return: A list with each mod's details, in the order of 'mod_ids'.
+        """
+        return self._map_concurrently(
+            lambda mod_id: self.mod_details(game, mod_id), mod_ids, max_workers
+        )
 
     def mod_search(self, game, md5_hash):
         """
@@ -246,9 +604,7 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param md5_hash: Mod md5 hash.
         """
-        return self._make_request(
-            "get", "games/{}/mods/md5_search/{}.json".format(game, md5_hash)
-        )
+        return self._make_request("get", _URL_MOD_SEARCH(game, md5_hash))
 
     def mod_endorse(self, game, mod_id):
         """
@@ -257,9 +613,7 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param mod_id: A string the mod id.
         """
-        return self._make_request(
-            "post", "games/{}/mods/{}/endorse.json".format(game, mod_id)
-        )
+        return self._make_request("post", _URL_MOD_ENDORSE(game, mod_id))
 
     def mod_abstain(self, game, mod_id):
         """
@@ -268,9 +622,7 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param mod_id: A string the mod id.
         """
-        return self._make_request(
-            "post", "games/{}/mods/{}/abstain.json".format(game, mod_id)
-        )
+        return self._make_request("post", _URL_MOD_ABSTAIN(game, mod_id))
 
     def mod_file_list(self, game, mod_id, categories=None):
         """
@@ -291,7 +643,7 @@ class Nexus(object):
         else:
             payload = None
         return self._make_request(
-            "get", "games/{}/mods/{}/files.json".format(game, mod_id), payload=payload
+            "get", _URL_MOD_FILE_LIST(game, mod_id), payload=payload
         )
 
     def mod_file_details(self, game, mod_id, file_id):
@@ -302,9 +654,7 @@ class Nexus(object):
         :param mod_id: A string the mod id.
         :param file_id: A string with the file id.
         """
-        return self._make_request(
-            "get", "games/{}/mods/{}/files/{}.json".format(game, mod_id, file_id)
-        )
+        return self._make_request("get", _URL_MOD_FILE_DETAILS(game, mod_id, file_id))
 
     def mod_file_download_link(self, game, mod_id, file_id, nxm_key=None, expires=None):
         """
@@ -325,8 +675,7 @@ class Nexus(object):
             payload = {"key": nxm_key, "expires": expires}
         return self._make_request(
             "get",
-            "games/{}/mods/{}/files/{}/"
-            "download_link.json".format(game, mod_id, file_id),
+            _URL_MOD_FILE_DOWNLOAD_LINK(game, mod_id, file_id),
             payload=payload,
         )
 
@@ -337,6 +686,131 @@ class Nexus(object):
         :param game: A string with Nexus' game domain.
         :param mod_id: A string the mod id.
         """
-        return self._make_request(
-            "get", "games/{}/mods/{}/changelogs.json".format(game, mod_id)
+        return self._make_request("get", _URL_MOD_CHANGELOG_LIST(game, mod_id))
+
+
+class AsyncNexus(Nexus):
+    """
+    The asynchronous counterpart to 'Nexus', built on aiohttp.
+    Requires the 'async' extra to be installed.
+
+    Every API method returns a coroutine, so many calls can be
+    run concurrently with 'asyncio.gather'.
+    Use it as an async context manager or call 'close' when done::
+
+        async with pynxm.AsyncNexus(api_key) as nxm:
+            mods = await asyncio.gather(
+                *(nxm.mod_details(game, mod_id) for mod_id in mod_ids)
+            )
+    """
+
+    __slots__ = ("_session_headers",)
+
+    def __init__(
+        self, api_key, pool_size=32, cache_size=128, max_retries=3, max_wait=60
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncNexus requires aiohttp, "
+                "install it with 'pip install pynxm[async]'."
+            )
+        super(AsyncNexus, self).__init__(
+            api_key, pool_size, cache_size, max_retries, max_wait
         )
+
+    def _setup_session(self, headers):
+        # aiohttp sessions must be created inside the event loop
+        self.session = None
+        self._session_headers = headers
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                headers=self._session_headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size, keepalive_timeout=75
+                ),
+            )
+        return self.session
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying connection session.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _map_concurrently(self, func, iterable, max_workers=None):
+        # without a limit, concurrency is bounded by the connector's 'pool_size'
+        if max_workers is None:
+            return list(await asyncio.gather(*map(func, iterable)))
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def limited(item):
+            async with semaphore:
+                return await func(item)
+
+        return list(await asyncio.gather(*map(limited, iterable)))
+
+    async def _make_request(
+        self, operation, endpoint, payload=None, data=None, headers=None
+    ):
+        if payload is None:
+            payload = {}
+        if headers is None:
+            headers = {}
+        # aiohttp only accepts strings and numbers as query values
+        payload = {key: str(value) for key, value in payload.items()}
+        if not endpoint.startswith(("http://", "https://")):
+            endpoint = BASE_URL + endpoint
+        cache_key, cached, headers = self._cache_lookup(
+            operation, endpoint, payload, headers
+        )
+        throttle = True
+        for attempt in range(self.max_retries + 1):
+            # a retry after 'Retry-After' has already waited as long as needed
+            if throttle:
+                delay = self.bucket.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+            throttle = True
+            try:
+                async with self._get_session().request(
+                    operation.upper(),
+                    endpoint,
+                    params=payload,
+                    data=data or None,
+                    headers=headers,
+                ) as response:
+                    status_code = response.status
+                    self._update_nexus_headers(response.headers, status_code)
+                    delay = self._retry_delay(attempt, status_code, response.headers)
+                    if delay is None:
+                        return await self._handle_response(
+                            response, status_code, cache_key, cached
+                        )
+                    throttle = status_code != 429
+            except aiohttp.ClientConnectionError:
+                if attempt == self.max_retries:
+                    raise
+                delay = _backoff_delay(attempt)
+            await asyncio.sleep(delay)
+
+    async def _handle_response(self, response, status_code, cache_key, cached):
+        if status_code == 304 and cached is not None:
+            return _loads(cached[1])
+        if status_code not in (200, 201):
+            self._raise_for_status(status_code, await response.read(), response.reason)
+        content = await response.read()
+        if cache_key is not None and "ETag" in response.headers:
+            self._etag_cache.put(cache_key, response.headers["ETag"], content)
+        return _loads(content)
@@ -1,13 +1,39 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pynxm
 import pytest
+import requests
 import responses
+from aioresponses import aioresponses
 
 TEST_INSTANCE = pynxm.Nexus("test-key")
 TEST_JSON = {"test": "content"}
 
 
+def run_async(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def rate_limit_headers(hourly_remaining, daily_remaining):
+    reset = datetime.now(timezone.utc) + timedelta(hours=1)
+    return {
+        "X-RL-Hourly-Limit": "100",
+        "X-RL-Hourly-Remaining": str(hourly_remaining),
+        "X-RL-Hourly-Reset": reset.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+        "X-RL-Daily-Limit": "2500",
+        "X-RL-Daily-Remaining": str(daily_remaining),
+        "X-RL-Daily-Reset": reset.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+    }
+
+
 @responses.activate
-def test_errors():
+def test_errors(monkeypatch):
+    monkeypatch.setattr(pynxm.time, "sleep", lambda _: None)
     responses.add(
         responses.GET,
         pynxm.BASE_URL + "test_endpoint1",
@@ -26,6 +52,16 @@ def test_errors():
     with pytest.raises(pynxm.RequestError) as excinfo:
         TEST_INSTANCE._make_request("get", "test_endpoint2")
         assert excinfo.value == "error message"
+    responses.add(
+        responses.GET,
+        pynxm.BASE_URL + "test_endpoint4",
+        body="<html>Service Unavailable</html>",
+        status=503,
+    )
+    with pytest.raises(
+        pynxm.RequestError, match="Status Code 503 - Service Unavailable"
+    ):
+        TEST_INSTANCE._make_request("get", "test_endpoint4")
     responses.add(responses.GET, pynxm.BASE_URL + "test_endpoint3", status=429)
     with pytest.raises(pynxm.LimitReachedError) as excinfo:
         TEST_INSTANCE._make_request("get", "test_endpoint3")
@@ -35,6 +71,95 @@ def test_errors():
         )
 
 
+@responses.activate
+def test_retries(monkeypatch):
+    delays = []
+    monkeypatch.setattr(pynxm.time, "sleep", delays.append)
+    test_url = pynxm.BASE_URL + "test_endpoint"
+    responses.add(responses.GET, test_url, body=requests.ConnectionError())
+    responses.add(responses.GET, test_url, status=503)
+    responses.add(responses.GET, test_url, status=429, headers={"Retry-After": "5"})
+    responses.add(responses.GET, test_url, json=TEST_JSON)
+    nxm = pynxm.Nexus("test-key")
+    assert nxm._make_request("get", "test_endpoint") == TEST_JSON
+    assert len(responses.calls) == 4
+    assert 0 <= delays[0] <= pynxm._BACKOFF_BASE
+    assert 0 <= delays[1] <= pynxm._BACKOFF_BASE * 2
+    assert delays[2] == 5
+
+
+@responses.activate
+def test_retry_after_skips_bucket(monkeypatch):
+    delays = []
+    monkeypatch.setattr(pynxm.time, "sleep", delays.append)
+    test_url = pynxm.BASE_URL + "test_endpoint"
+    headers = rate_limit_headers(0, 0)
+    headers["Retry-After"] = "5"
+    responses.add(responses.GET, test_url, status=429, headers=headers)
+    responses.add(responses.GET, test_url, json=TEST_JSON)
+    nxm = pynxm.Nexus("test-key")
+    assert nxm._make_request("get", "test_endpoint") == TEST_JSON
+    assert delays == [5]
+
+
+@responses.activate
+def test_nexus_headers():
+    headers = {
+        "X-RL-Hourly-Limit": "100",
+        "X-RL-Hourly-Remaining": "99",
+        "X-Request-Id": "id",
+    }
+    responses.add(
+        responses.GET,
+        pynxm.BASE_URL + "test_endpoint",
+        json=TEST_JSON,
+        headers=headers,
+    )
+    nxm = pynxm.Nexus("test-key")
+    nxm._make_request("get", "test_endpoint")
+    assert nxm.nexus_headers == {
+        "X-RL-Hourly-Limit": "100",
+        "X-RL-Hourly-Remaining": "99",
+    }
+
+
+@responses.activate
+def test_etag_cache():
+    test_url = pynxm.BASE_URL + "test_endpoint"
+    responses.add(responses.GET, test_url, json=TEST_JSON, headers={"ETag": '"tag"'})
+    responses.add(responses.GET, test_url, status=304)
+    nxm = pynxm.Nexus("test-key")
+    content = nxm._make_request("get", "test_endpoint")
+    assert content == TEST_JSON
+    content["test"] = "modified"
+    assert nxm._make_request("get", "test_endpoint") == TEST_JSON
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-None-Match"] == '"tag"'
+
+
+def test_token_bucket():
+    bucket = pynxm.TokenBucket(max_wait=None)
+    assert bucket.reserve() == 0
+    bucket.update(rate_limit_headers(2, 0))
+    assert bucket.capacity == 100
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # the last token is spread over the remaining hour
+    assert 1700 < bucket.reserve() <= 1800
+
+
+def test_token_bucket_limited():
+    bucket = pynxm.TokenBucket(max_wait=None)
+    for _ in range(6):
+        bucket.update(rate_limit_headers(0, 0), limited=True)
+    # backing off never waits past the reset
+    assert 3500 < bucket.reserve() <= 3600
+    bucket = pynxm.TokenBucket()
+    bucket.update(rate_limit_headers(0, 0), limited=True)
+    with pytest.raises(pynxm.LimitReachedError):
+        bucket.reserve()
+
+
 @responses.activate
 def test_colour_schemes_list():
     responses.add(responses.GET, pynxm.BASE_URL + "colourschemes.json", json=TEST_JSON)
@@ -66,6 +191,18 @@ def test_user_tracked_add():
     assert request.body == "{}={}".format("mod_id", "mod_id")
 
 
+@responses.activate
+def test_user_tracked_add_many():
+    test_url = pynxm.BASE_URL + "user/tracked_mods.json"
+    responses.add(responses.POST, test_url, json=TEST_JSON)
+    assert TEST_INSTANCE.user_tracked_add_many("game", ["mod1", "mod 2&"]) == [
+        TEST_JSON,
+        TEST_JSON,
+    ]
+    bodies = sorted(call.request.body for call in responses.calls)
+    assert bodies == ["mod_id=mod+2%26", "mod_id=mod1"]
+
+
 @responses.activate
 def test_user_tracked_delete():
     test_url = pynxm.BASE_URL + "user/tracked_mods.json"
@@ -105,6 +242,8 @@ def test_game_updated_list():
     responses.add(responses.GET, test_url, json=TEST_JSON)
     assert TEST_INSTANCE.game_updated_list("game_id", "1d") == TEST_JSON
     assert responses.calls[0].request.url == test_url + "?period=1d"
+    with pytest.raises(ValueError):
+        TEST_INSTANCE.game_updated_list("game_id", "1y")
 
 
 @responses.activate
@@ -145,6 +284,19 @@ def test_mod_details():
     assert TEST_INSTANCE.mod_details("game_id", "mod_id") == TEST_JSON
 
 
+@responses.activate
+def test_mod_details_many():
+    for mod_id in ("mod_id1", "mod_id2", "mod_id3"):
+        responses.add(
+            responses.GET,
+            pynxm.BASE_URL + "games/game_id/mods/{}.json".format(mod_id),
+            json={"mod_id": mod_id},
+        )
+    assert TEST_INSTANCE.mod_details_many(
+        "game_id", ["mod_id1", "mod_id2", "mod_id3"], max_workers=2
+    ) == [{"mod_id": "mod_id1"}, {"mod_id": "mod_id2"}, {"mod_id": "mod_id3"}]
+
+
 @responses.activate
 def test_mod_search():
     responses.add(
@@ -217,3 +369,87 @@ def test_mod_changelog_list():
         json=TEST_JSON,
     )
     assert TEST_INSTANCE.mod_changelog_list("game_id", "mod_id") == TEST_JSON
+
+
+def test_async_errors():
+    async def make_requests():
+        async with pynxm.AsyncNexus("test-key") as nxm:
+            with aioresponses() as mocked:
+                mocked.get(
+                    pynxm.BASE_URL + "test_endpoint1",
+                    payload={"error": "error message"},
+                    status=404,
+                )
+                with pytest.raises(pynxm.RequestError):
+                    await nxm._make_request("get", "test_endpoint1")
+                mocked.get(pynxm.BASE_URL + "test_endpoint2", status=429)
+                with pytest.raises(pynxm.LimitReachedError):
+                    await nxm._make_request("get", "test_endpoint2")
+
+    run_async(make_requests())
+
+
+def test_async_mod_details():
+    async def make_requests():
+        async with pynxm.AsyncNexus("test-key") as nxm:
+            with aioresponses() as mocked:
+                for mod_id in ("mod_id1", "mod_id2"):
+                    mocked.get(
+                        pynxm.BASE_URL + "games/game_id/mods/{}.json".format(mod_id),
+                        payload=TEST_JSON,
+                    )
+                return await asyncio.gather(
+                    nxm.mod_details("game_id", "mod_id1"),
+                    nxm.mod_details("game_id", "mod_id2"),
+                )
+
+    assert run_async(make_requests()) == [TEST_JSON, TEST_JSON]
+
+
+def test_async_game_list():
+    async def make_requests():
+        async with pynxm.AsyncNexus("test-key") as nxm:
+            with aioresponses() as mocked:
+                mocked.get(
+                    pynxm.BASE_URL + "games.json?include_unapproved=False",
+                    payload=TEST_JSON,
+                )
+                return await nxm.game_list()
+
+    assert run_async(make_requests()) == TEST_JSON
+
+
+def test_async_user_tracked_add_many():
+    async def make_requests():
+        async with pynxm.AsyncNexus("test-key") as nxm:
+            with aioresponses() as mocked:
+                test_url = pynxm.BASE_URL + "user/tracked_mods.json?domain_name=game"
+                mocked.post(test_url, payload=TEST_JSON, repeat=True)
+                return await nxm.user_tracked_add_many("game", ["mod1", "mod2"])
+
+    assert run_async(make_requests()) == [TEST_JSON, TEST_JSON]
+
+
+def test_async_mod_details_many():
+    in_flight = []
+    peak = []
+
+    async def callback(url, **kwargs):
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(url)
+
+    async def make_requests():
+        async with pynxm.AsyncNexus("test-key") as nxm:
+            with aioresponses() as mocked:
+                for mod_id in range(10):
+                    mocked.get(
+                        pynxm.BASE_URL + "games/game_id/mods/{}.json".format(mod_id),
+                        payload={"mod_id": mod_id},
+                        callback=callback,
+                    )
+                return await nxm.mod_details_many("game_id", range(10), max_workers=2)
+
+    assert run_async(make_requests()) == [{"mod_id": mod_id} for mod_id in range(10)]
+    assert max(peak) == 2